@@ -65,6 +65,12 @@ codegen_parser.add_argument(
     action="store_true",
     help="Use Pydantic models for generated classes.",
 )
+codegen_parser.add_argument(
+    "--no-format",
+    "--no_format",
+    action="store_true",
+    help="Skip formatting the generated code with black, this is much faster.",
+)
 
 
 def load_config(config) -> dict:
@@ -93,7 +99,12 @@ def resolve_scalars(scalars: list[str]) -> list[ScalarInterface]:
 
 
 def run_codegen(
-    dry_run: bool, schema: str, dest: str, scalars: list[str] | None, use_pydantic: bool
+    dry_run: bool,
+    schema: str,
+    dest: str,
+    scalars: list[str] | None,
+    use_pydantic: bool,
+    pretty: bool = True,
 ):
     source = pathlib.Path(schema)
     documents = cannula.load_schema(source)
@@ -105,6 +116,7 @@ def run_codegen(
         dry_run=dry_run,
         scalars=_scalars,
         use_pydantic=use_pydantic,
+        pretty=pretty,
     )
 
 
@@ -126,10 +138,12 @@ def main():
             dest = codegen_config.get("dest", options.dest)
             scalars = codegen_config.get("scalars", options.scalars)
             use_pydantic = codegen_config.get("use_pydantic", options.use_pydantic)
+            no_format = codegen_config.get("no_format", options.no_format)
             run_codegen(
                 dry_run=options.dry_run,
                 schema=schema,
                 dest=dest,
                 scalars=scalars,
                 use_pydantic=use_pydantic,
+                pretty=not no_format,
             )
@@ -6,6 +6,7 @@ Code Generation
 import collections
 import logging
 import pathlib
+import types
 import typing
 
 from cannula.codegen.generate_types import PythonCodeGenerator
@@ -14,62 +15,150 @@ from cannula.codegen.generate_context import ContextGenerator
 from cannula.codegen.schema_analyzer import SchemaAnalyzer
 from cannula.scalars import ScalarInterface
 from cannula.schema import Imports, build_and_extend_schema
-from graphql import DocumentNode
+from graphql import DocumentNode, print_ast
 
 LOG = logging.getLogger(__name__)
 
-_IMPORTS: Imports = collections.defaultdict(set[str])
-_IMPORTS.update(
+# Every name the generated modules might use, the unused ones are removed
+# when the code is formatted. This is shared by every render so it is frozen,
+# each schema gets its own copy that custom scalars can add imports to.
+_IMPORTS: typing.Mapping[str, frozenset[str]] = types.MappingProxyType(
     {
-        "__future__": {"annotations"},
-        "abc": {"ABC", "abstractmethod"},
-        "cannula": {"ResolveInfo"},
-        "cannula.context": {"Context as BaseContext"},
-        "cannula.datasource.orm": {"DatabaseRepository"},
-        "dataclasses": {"dataclass"},
-        "pydantic": {"BaseModel"},
-        "typing": {
-            "Any",
-            "Awaitable",
-            "Sequence",
-            "Optional",
-            "Protocol",
-            "TYPE_CHECKING",
-            "Union",
-        },
-        "typing_extensions": {"TypedDict", "NotRequired"},
-        "sqlalchemy": {"ForeignKey", "select", "func", "column", "text", "true"},
-        "sqlalchemy.ext.asyncio": {"AsyncAttrs", "async_sessionmaker"},
-        "sqlalchemy.orm": {
-            "DeclarativeBase",
-            "mapped_column",
-            "Mapped",
-            "relationship",
-        },
+        "__future__": frozenset({"annotations"}),
+        "abc": frozenset({"ABC", "abstractmethod"}),
+        "cannula": frozenset({"ResolveInfo"}),
+        "cannula.context": frozenset({"Context as BaseContext"}),
+        "cannula.datasource.orm": frozenset({"DatabaseRepository"}),
+        "dataclasses": frozenset({"dataclass"}),
+        "pydantic": frozenset({"BaseModel"}),
+        "typing": frozenset(
+            {
+                "Any",
+                "Awaitable",
+                "Sequence",
+                "Optional",
+                "Protocol",
+                "TYPE_CHECKING",
+                "Union",
+            }
+        ),
+        "typing_extensions": frozenset({"TypedDict", "NotRequired"}),
+        "sqlalchemy": frozenset(
+            {"ForeignKey", "select", "func", "column", "text", "true"}
+        ),
+        "sqlalchemy.ext.asyncio": frozenset({"AsyncAttrs", "async_sessionmaker"}),
+        "sqlalchemy.orm": frozenset(
+            {
+                "DeclarativeBase",
+                "mapped_column",
+                "Mapped",
+                "relationship",
+            }
+        ),
     }
 )
 
 
+def _default_imports() -> Imports:
+    """Create a new copy of the default imports for a schema."""
+    return collections.defaultdict(
+        set[str], {module: set(names) for module, names in _IMPORTS.items()}
+    )
+
+
 class Generated(typing.TypedDict):
     types: str
     sql: str
     context: str
 
 
+# Rendered output of the most recent schemas, the output only depends on
+# the schema source and options so repeated renders (tests, watchers) of
+# an unchanged schema can skip the schema build and formatting entirely.
+_RENDER_CACHE: dict[typing.Hashable, Generated] = {}
+# The analyzed schema does not depend on the options, this lets the
+# dataclass and pydantic renders of the same schema share the analysis.
+_ANALYZER_CACHE: dict[typing.Hashable, SchemaAnalyzer] = {}
+_RENDER_CACHE_SIZE = 32
+
+_T = typing.TypeVar("_T")
+
+
+def _cache_result(
+    cache: dict[typing.Hashable, _T], key: typing.Hashable, value: _T
+) -> None:
+    # Drop the oldest entry when the cache is full
+    if len(cache) >= _RENDER_CACHE_SIZE:
+        del cache[next(iter(cache))]
+    cache[key] = value
+
+
+def clear_render_cache() -> None:
+    """Remove all the cached output and schemas of `render_code`."""
+    _RENDER_CACHE.clear()
+    _ANALYZER_CACHE.clear()
+
+
+def document_source(type_def: typing.Union[str, DocumentNode]) -> str:
+    """Get the source text of a schema document to use as a cache key."""
+    if isinstance(type_def, str):
+        return type_def
+
+    # Parsed documents keep a reference to the original source
+    if type_def.loc is not None:
+        return type_def.loc.source.body
+
+    return print_ast(type_def)
+
+
 def render_code(
     type_defs: typing.Iterable[typing.Union[str, DocumentNode]],
     scalars: list[ScalarInterface] = [],
     use_pydantic: bool = False,
+    pretty: bool = True,
 ) -> Generated:
-    schema = build_and_extend_schema(type_defs, scalars, {"imports": _IMPORTS})
-    analyzer = SchemaAnalyzer(schema)
+    type_defs = list(type_defs)
+    # Scalars only need to implement the protocol and may not be hashable,
+    # the generated code only depends on their name and imports.
+    schema_key = (
+        tuple(document_source(type_def) for type_def in type_defs),
+        tuple((s.name, s.input_module, s.output_module) for s in scalars),
+    )
+    cache_key = (schema_key, use_pydantic, pretty)
+    if cached := _RENDER_CACHE.get(cache_key):
+        LOG.debug("Using cached output for schema")
+        return cached.copy()
+
+    analyzer = _ANALYZER_CACHE.get(schema_key)
+    if analyzer is None:
+        schema = build_and_extend_schema(
+            type_defs, scalars, {"imports": _default_imports()}
+        )
+        analyzer = SchemaAnalyzer(schema)
+        _cache_result(_ANALYZER_CACHE, schema_key, analyzer)
+
+    types = PythonCodeGenerator(analyzer, pretty).generate(use_pydantic)
 
-    return {
-        "types": PythonCodeGenerator(analyzer).generate(use_pydantic),
-        "sql": SQLAlchemyGenerator(analyzer).generate(),
-        "context": ContextGenerator(analyzer).generate(),
+    # Only the types depend on `use_pydantic`, when the schema was already
+    # rendered in the other mode the sql and context output is reused.
+    other_mode = _RENDER_CACHE.get((schema_key, not use_pydantic, pretty))
+    if other_mode is not None:
+        sql = other_mode["sql"]
+        context = other_mode["context"]
+    else:
+        sql = SQLAlchemyGenerator(analyzer, pretty).generate()
+        context = ContextGenerator(analyzer, pretty).generate()
+
+    generated: Generated = {
+        "types": types,
+        "sql": sql,
+        "context": context,
     }
 
+    _cache_result(_RENDER_CACHE, cache_key, generated)
+
+    return generated.copy()
+
 
 def render_file(
     type_defs: typing.Iterable[typing.Union[str, DocumentNode]],
@@ -77,9 +166,13 @@ def render_file(
     scalars: list[ScalarInterface] = [],
     use_pydantic: bool = False,
     dry_run: bool = False,
+    pretty: bool = True,
 ) -> None:
     formatted_code = render_code(
-        type_defs=type_defs, scalars=scalars, use_pydantic=use_pydantic
+        type_defs=type_defs,
+        scalars=scalars,
+        use_pydantic=use_pydantic,
+        pretty=pretty,
     )
 
     if dry_run:
@@ -88,12 +181,16 @@ def render_file(
 
     dest.mkdir(parents=True, exist_ok=True)
 
-    if formatted_code["types"]:
-        with open(dest / "types.py", "w") as types_file:
-            types_file.write(formatted_code["types"])
-    if formatted_code["sql"]:
-        with open(dest / "sql.py", "w") as sql_file:
-            sql_file.write(formatted_code["sql"])
-    if formatted_code["context"]:
-        with open(dest / "context.py", "w") as context_file:
-            context_file.write(formatted_code["context"])
+    for name, content in typing.cast(dict[str, str], formatted_code).items():
+        if not content:
+            continue
+
+        generated_path = dest / f"{name}.py"
+        # Leave the file (and its mtime) alone when nothing changed so that
+        # watchers and build caches are not triggered by a no-op codegen run.
+        if generated_path.is_file() and generated_path.read_text() == content:
+            LOG.debug(f"{generated_path} is unchanged, skipping write")
+            continue
+
+        with open(generated_path, "w") as generated_file:
+            generated_file.write(content)
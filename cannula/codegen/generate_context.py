@@ -14,6 +14,7 @@ from cannula.errors import SchemaValidationError
 from cannula.format import format_code
 from cannula.types import Field
 from cannula.utils import (
+    SELF_ARG,
     ast_for_annotation_assignment,
     ast_for_import_from,
     ast_for_name,
@@ -30,7 +31,7 @@ class ContextGenerator(CodeGenerator):
     ) -> ast.AsyncFunctionDef:
         """Create a method for fetching related objects"""
         args = [
-            ast.arg(arg="self"),
+            SELF_ARG,
             *[arg.as_ast for arg in related_field.related_args],
             *related_field.positional_args,
         ]
@@ -64,7 +65,7 @@ class ContextGenerator(CodeGenerator):
                 value=ast.Await(
                     value=ast.Call(
                         func=ast.Attribute(
-                            value=ast.Name(id="self", ctx=ast.Load()),
+                            value=ast_for_name("self"),
                             attr=cls_method,
                             ctx=ast.Load(),
                         ),
@@ -90,6 +91,7 @@ class ContextGenerator(CodeGenerator):
             decorator_list=[],
             returns=ast_for_name(related_field.type),
             type_params=[],  # type: ignore
+            lineno=None,  # type: ignore
         )
 
     def create_datasource_class(self, type_info: ObjectType) -> ast.ClassDef:
@@ -184,6 +186,7 @@ class ContextGenerator(CodeGenerator):
                         args=[ast_for_name("session_maker")],
                         keywords=[],
                     ),
+                    lineno=None,  # type: ignore
                 )
             )
 
@@ -193,7 +196,7 @@ class ContextGenerator(CodeGenerator):
             args=ast.arguments(
                 posonlyargs=[],
                 args=[
-                    ast.arg(arg="self"),
+                    SELF_ARG,
                     ast.arg(
                         arg="session_maker",
                         annotation=ast_for_name("async_sessionmaker"),
@@ -209,6 +212,7 @@ class ContextGenerator(CodeGenerator):
             decorator_list=[],
             returns=None,
             type_params=[],  # type: ignore
+            lineno=None,  # type: ignore
         )
 
         return ast.ClassDef(
@@ -222,14 +226,21 @@ class ContextGenerator(CodeGenerator):
 
     def generate(self) -> str:
         """Generate the complete context.py file"""
-        db_types = self.get_db_types()
+        # Collect the db types and the names to import in a single pass
+        db_types: List[ObjectType] = []
+        model_types: set[str] = set()
+        db_model_types: set[str] = set()
+        for type_info in self.analyzer.object_types:
+            model_types.add(type_info.py_type)
+            if type_info.is_db_type:
+                db_types.append(type_info)
+                db_model_types.add(type_info.db_type)
+
         if not db_types:
             return ""
 
         body: List[ast.stmt] = []
 
-        model_types = {type_info.py_type for type_info in self.analyzer.object_types}
-        db_model_types = {type_info.db_type for type_info in db_types}
         # Add required imports
         body.extend(
             [
@@ -250,4 +261,4 @@ class ContextGenerator(CodeGenerator):
         # Create and format the complete module
         module = self.create_module(body)
 
-        return format_code(module)
+        return format_code(module, pretty=self.pretty)
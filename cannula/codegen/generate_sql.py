@@ -1,4 +1,4 @@
-from typing import List
+from typing import AbstractSet, Dict, List, Tuple
 import ast
 
 from cannula.utils import (
@@ -10,15 +10,51 @@ from cannula.utils import (
     ast_for_name,
     ast_for_subscript,
 )
-from cannula.codegen.schema_analyzer import ObjectType, CodeGenerator
+from cannula.codegen.schema_analyzer import ObjectType, CodeGenerator, SchemaAnalyzer
 from cannula.errors import SchemaValidationError
 from cannula.format import format_code
 from cannula.types import Field
 
+# Names that are referenced by every model or column
+_BASE = ast_for_name("Base")
+_DECLARATIVE_BASE = ast_for_name("DeclarativeBase")
+_FOREIGN_KEY = ast_for_name("ForeignKey")
+_MAPPED = ast_for_name("Mapped")
+_MAPPED_COLUMN = ast_for_name("mapped_column")
+
+# Every module starts with the same `class Base(DeclarativeBase): pass`
+_BASE_CLASS = ast.ClassDef(
+    name="Base",
+    bases=[_DECLARATIVE_BASE],
+    keywords=[],
+    body=[PASS],
+    decorator_list=[],
+    type_params=[],  # type: ignore
+)
+
+# The boolean column options only have a couple of possible values
+_KW_PRIMARY_KEY = ast_for_keyword("primary_key", True)
+_KW_INDEX = ast_for_keyword("index", True)
+_KW_UNIQUE = ast_for_keyword("unique", True)
+_KW_NULLABLE = {
+    True: ast_for_keyword("nullable", True),
+    False: ast_for_keyword("nullable", False),
+}
+
 
 class SQLAlchemyGenerator(CodeGenerator):
     """Generates SQLAlchemy models from GraphQL schema."""
 
+    def __init__(self, analyzer: SchemaAnalyzer, pretty: bool = True):
+        super().__init__(analyzer, pretty)
+        # Index of (field, foreign_key) collected while the columns are
+        # created, this is used to validate the relationships afterwards.
+        self.foreign_keys: List[Tuple[Field, str]] = []
+        # Most columns share a handful of types so reuse the annotations
+        self.mapped_annotations: Dict[str, ast.Subscript] = {}
+        # Several columns often point at the same foreign key target
+        self.foreign_key_keywords: Dict[str, ast.keyword] = {}
+
     def get_primary_key_fields(self, type_info: ObjectType) -> List[str]:
         """Get list of field names that are marked as primary keys."""
         primary_keys = []
@@ -27,6 +63,43 @@ class SQLAlchemyGenerator(CodeGenerator):
                 primary_keys.append(field.name)
         return primary_keys
 
+    def has_multiple_primary_keys(self, type_info: ObjectType) -> bool:
+        """Check if more than one field is marked as a primary key.
+
+        This stops at the second primary key instead of collecting them all.
+        """
+        found = False
+        for field in type_info.fields:
+            if field.metadata.primary_key:
+                if found:
+                    return True
+                found = True
+        return False
+
+    def get_mapped_annotation(self, type_name: str) -> ast.Subscript:
+        """Get the shared `Mapped[type_name]` annotation node."""
+        annotation = self.mapped_annotations.get(type_name)
+        if annotation is None:
+            annotation = ast_for_subscript(_MAPPED, type_name)
+            self.mapped_annotations[type_name] = annotation
+        return annotation
+
+    def get_foreign_key_keyword(self, foreign_key: str) -> ast.keyword:
+        """Get the shared `foreign_key=ForeignKey("table.column")` keyword node."""
+        keyword = self.foreign_key_keywords.get(foreign_key)
+        if keyword is None:
+            # This does not use a constant so we cannot use ast_for_keyword
+            keyword = ast.keyword(
+                arg="foreign_key",
+                value=ast.Call(
+                    func=_FOREIGN_KEY,
+                    args=[ast.Constant(value=foreign_key)],
+                    keywords=[],
+                ),
+            )
+            self.foreign_key_keywords[foreign_key] = keyword
+        return keyword
+
     def create_column_args(
         self, field: Field
     ) -> tuple[list[ast.expr], list[ast.keyword]]:
@@ -34,45 +107,41 @@ class SQLAlchemyGenerator(CodeGenerator):
         args: list[ast.expr] = []
         keywords: list[ast.keyword] = []
 
+        metadata = field.metadata
+
         # Handle primary key
-        is_primary_key = field.metadata.primary_key
-        if field.metadata.primary_key:
-            keywords.append(ast_for_keyword("primary_key", True))
+        is_primary_key = metadata.primary_key
+        if is_primary_key:
+            keywords.append(_KW_PRIMARY_KEY)
 
         # Handle foreign key
-        if foreign_key := field.metadata.foreign_key:
-            keywords.append(
-                # This does not use a constant so we cannot use ast_for_keyword
-                ast.keyword(
-                    arg="foreign_key",
-                    value=ast.Call(
-                        func=ast_for_name("ForeignKey"),
-                        args=[ast.Constant(value=foreign_key)],
-                        keywords=[],
-                    ),
-                )
-            )
+        if foreign_key := metadata.foreign_key:
+            self.foreign_keys.append((field, foreign_key))
+            keywords.append(self.get_foreign_key_keyword(foreign_key))
 
-        # Handle index
-        if not is_primary_key and field.metadata.index:
-            keywords.append(ast_for_keyword(arg="index", value=True))
+        # Primary keys are always indexed and unique so these are only
+        # checked for the other columns.
+        if not is_primary_key:
+            # Handle index
+            if metadata.index:
+                keywords.append(_KW_INDEX)
 
-        # Handle unique constraint
-        if not is_primary_key and field.metadata.unique:
-            keywords.append(ast_for_keyword(arg="unique", value=True))
+            # Handle unique constraint
+            if metadata.unique:
+                keywords.append(_KW_UNIQUE)
 
         # Handle custom column name
-        if db_column := field.metadata.db_column:
+        if db_column := metadata.db_column:
             keywords.append(ast_for_keyword(arg="name", value=db_column))
 
         # Handle nullable based on GraphQL schema
         if not is_primary_key:
-            metadata_nullable = field.metadata.nullable
+            metadata_nullable = metadata.nullable
             # GraphQL non-null fields are not nullable unless explicitly overridden
             nullable = (
                 not field.required if metadata_nullable is None else metadata_nullable
             )
-            keywords.append(ast_for_keyword(arg="nullable", value=nullable))
+            keywords.append(_KW_NULLABLE[bool(nullable)])
 
         return args, keywords
 
@@ -84,16 +153,15 @@ class SQLAlchemyGenerator(CodeGenerator):
         # Validate Field Metadata
         field.validate_field_metadata()
 
-        func_name = "mapped_column"
         args, keywords = self.create_column_args(field)
         # Create the Mapped[Type] annotation
-        mapped_type = ast_for_subscript(ast_for_name("Mapped"), field.field_type.type)
+        mapped_type = self.get_mapped_annotation(field.field_type.type)
 
         return ast_for_annotation_assignment(
             target=field.name,
             annotation=mapped_type,
             default=ast.Call(
-                func=ast_for_name(func_name),
+                func=_MAPPED_COLUMN,
                 args=args,
                 keywords=keywords,
             ),
@@ -102,14 +170,14 @@ class SQLAlchemyGenerator(CodeGenerator):
     def create_model_class(self, type_info: ObjectType) -> ast.ClassDef:
         """Create an AST ClassDef node for a SQLAlchemy model."""
         # Check for multiple primary keys
-        primary_keys = self.get_primary_key_fields(type_info)
-
         has_composite_key = (
             type_info.sqlmetadata.composite_primary_key
             if type_info.sqlmetadata
             else False
         )
-        if len(primary_keys) > 1 and not has_composite_key:
+        if not has_composite_key and self.has_multiple_primary_keys(type_info):
+            # Only collect the names when we need them for the error
+            primary_keys = self.get_primary_key_fields(type_info)
             error_msg = (
                 f"Multiple primary keys found in type '{type_info.name}': {', '.join(primary_keys)}. "
                 "To create a composite primary key, add 'composite_primary_key: true' to the type's metadata."
@@ -131,69 +199,62 @@ class SQLAlchemyGenerator(CodeGenerator):
         )
 
         # Add fields
-        for field in type_info.fields:
-            if field.is_computed:
-                continue
-
-            field_def = self.create_field_definition(field, type_info)
-            body.append(field_def)
+        body.extend(
+            [
+                self.create_field_definition(field, type_info)
+                for field in type_info.storage_fields
+            ]
+        )
 
         return ast.ClassDef(
             name=type_info.db_type,
-            bases=[ast_for_name("Base")],
+            bases=[_BASE],
             keywords=[],
             body=body,
             decorator_list=[],
             type_params=[],  # type: ignore
         )
 
-    def validate_relationships(self) -> None:
+    def validate_relationships(self, db_tables: AbstractSet[str]) -> None:
         """Validate that relationships reference valid database tables and have proper foreign keys."""
-        db_tables = [t.db_table for t in self.get_db_types()]
-
-        for type_info in self.analyzer.object_types:
-            if not type_info.is_db_type:
-                continue
-
-            for field in type_info.fields:
-                if fk := field.metadata.foreign_key:
-                    _table, _column = fk.split(".")
-                    # Ensure the related type is also a database table
-                    if _table not in db_tables:
-                        raise SchemaValidationError(
-                            f"{field} references foreign_key '{fk}' "
-                            "which is not marked as a database table"
-                        )
+        for field, fk in self.foreign_keys:
+            _table, _, _column = fk.partition(".")
+            # Ensure the foreign key names both the table and the column
+            if not _column:
+                raise SchemaValidationError(
+                    f"{field} references foreign_key '{fk}' "
+                    "which is not in the format 'table.column'"
+                )
+            # Ensure the related type is also a database table
+            if _table not in db_tables:
+                raise SchemaValidationError(
+                    f"{field} references foreign_key '{fk}' "
+                    "which is not marked as a database table"
+                )
 
     def generate(self) -> str:
         """Generate SQLAlchemy models from the schema."""
-        db_tables = self.get_db_types()
-        if not db_tables:
-            return ""
-
-        # Create base class definition
-        body: list[ast.stmt] = [
-            ast.ClassDef(
-                name="Base",
-                bases=[ast_for_name("DeclarativeBase")],
-                keywords=[],
-                body=[PASS],
-                decorator_list=[],
-                type_params=[],  # type: ignore
-            )
-        ]
+        self.foreign_keys = []
+        db_tables: set[str] = set()
+        model_classes: list[ast.stmt] = []
 
-        # Generate model classes for each type
+        # Generate model classes for each type while collecting the
+        # table names, this way the object types are only walked once.
         for type_info in self.analyzer.object_types:
-            if not type_info.is_db_type:
+            if not (db_table := type_info.db_table):
                 continue
 
-            model_class = self.create_model_class(type_info)
-            body.append(model_class)
+            db_tables.add(db_table)
+            model_classes.append(self.create_model_class(type_info))
+
+        if not model_classes:
+            return ""
 
         # Validate all relationships
-        self.validate_relationships()
+        self.validate_relationships(db_tables)
+
+        body: list[ast.stmt] = [_BASE_CLASS, *model_classes]
 
         # Create and format the complete module
         module = self.create_module(body)
-        return format_code(module)
+        return format_code(module, pretty=self.pretty)
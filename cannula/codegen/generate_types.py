@@ -1,10 +1,10 @@
 import ast
 import logging
-from typing import List, cast
 
 from cannula.format import format_code
 from cannula.utils import (
     ELLIPSIS,
+    SELF_ARG,
     ast_for_annotation_assignment,
     ast_for_assign,
     ast_for_constant,
@@ -19,6 +19,38 @@ from cannula.codegen.schema_analyzer import CodeGenerator, ObjectType
 
 LOG = logging.getLogger(__name__)
 
+# The generated context is only imported for type checking, this is
+# the same for every module so only build it once.
+_TYPE_CHECKING_CONTEXT = ast.If(
+    test=ast_for_name("TYPE_CHECKING"),
+    body=[
+        ast_for_import_from(
+            module="context",
+            names={"Context"},
+            level=1,
+        )
+    ],
+    orelse=[],
+)
+
+# Nodes that are the same for every generated class or resolver
+_ABC = ast_for_name("ABC")
+_BASE_MODEL = ast_for_name("BaseModel")
+_PROTOCOL = ast_for_name("Protocol")
+_TYPED_DICT = ast_for_name("TypedDict")
+_INFO_ARG = ast.arg(
+    "info",
+    annotation=ast_for_single_subscript(
+        ast_for_name("ResolveInfo"), ast_for_constant("Context")
+    ),
+)
+_DATACLASS_DECORATOR = ast.Call(
+    func=ast_for_name("dataclass"),
+    args=[],
+    keywords=[ast_for_keyword("kw_only", True)],
+)
+_ROOT_TYPE_KEYWORDS = [ast_for_keyword("total", False)]
+
 
 def ast_for_function_body(field: Field) -> list[ast.stmt]:
     body: list[ast.stmt] = []
@@ -28,6 +60,19 @@ def ast_for_function_body(field: Field) -> list[ast.stmt]:
     return body
 
 
+def ast_for_resolver_args(field: Field) -> ast.arguments:
+    """Arguments for a resolver method `(self, info, *args, **kwargs)`"""
+    return ast.arguments(
+        args=[SELF_ARG, _INFO_ARG, *field.positional_args],
+        vararg=None,
+        posonlyargs=[],
+        kwonlyargs=field.kwonlyargs,
+        kw_defaults=field.kwdefaults,
+        kwarg=None,
+        defaults=[],
+    )
+
+
 class PythonCodeGenerator(CodeGenerator):
     """Generates Python code from analyzed GraphQL schema"""
 
@@ -35,31 +80,12 @@ class PythonCodeGenerator(CodeGenerator):
 
     def render_computed_field(self, field: Field) -> ast.AsyncFunctionDef:
         """Create an AST node for a computed field method"""
-        args = [
-            ast.arg("self"),
-            ast.arg(
-                "info",
-                annotation=ast_for_single_subscript(
-                    ast_for_name("ResolveInfo"), ast_for_constant("Context")
-                ),
-            ),
-            *field.positional_args,
-        ]
-
-        args_node = ast.arguments(
-            args=args,
-            vararg=None,
-            posonlyargs=[],
-            kwonlyargs=field.kwonlyargs,
-            kw_defaults=field.kwdefaults,
-            kwarg=None,
-            defaults=[],
-        )
+        args_node = ast_for_resolver_args(field)
         body = ast_for_function_body(field)
 
         call_args: list[ast.expr] = []
         if field.fk_field is not None and not field.keywords:
-            call_args.append(cast(ast.expr, ast.arg(f"self.{field.fk_field.name}")))
+            call_args.append(ast_for_name(f"self.{field.fk_field.name}"))
 
         body.append(
             ast.Return(
@@ -83,8 +109,9 @@ class PythonCodeGenerator(CodeGenerator):
             body=body,
             decorator_list=[],
             # decorator_list=[ast.Name(id="abstractmethod", ctx=ast.Load())],
-            returns=ast.Name(id=field.type, ctx=ast.Load()),
+            returns=ast_for_name(field.type),
             type_params=[],  # type: ignore
+            lineno=None,  # type: ignore
         )
 
     def render_object_type(
@@ -104,38 +131,29 @@ class PythonCodeGenerator(CodeGenerator):
 
         # Render non-computed as class vars and add them to body first
         normal_fields: list[ast.stmt] = [
-            f.as_class_var for f in type_info.fields if not f.is_computed
+            f.as_class_var for f in type_info.storage_fields
         ]
         body.extend(normal_fields)
 
         # Render computed fields as functions and add them at end of body
         computed_fields: list[ast.stmt] = [
-            self.render_computed_field(f) for f in type_info.fields if f.is_computed
+            self.render_computed_field(f) for f in type_info.computed_fields
         ]
         body.extend(computed_fields)
 
-        base_class = "BaseModel" if use_pydantic else "ABC"
+        base_class = _BASE_MODEL if use_pydantic else _ABC
         decorators: list[ast.expr] = []
         if not use_pydantic:
-            decorators.append(
-                ast.Call(
-                    func=ast_for_name("dataclass"),
-                    args=[],
-                    keywords=[ast_for_keyword("kw_only", True)],
-                )
-            )
+            decorators.append(_DATACLASS_DECORATOR)
 
         return [
-            cast(
-                ast.stmt,
-                ast.ClassDef(
-                    name=type_info.py_type,
-                    bases=[ast_for_name(base_class)],
-                    keywords=[],
-                    body=body,
-                    decorator_list=decorators,
-                    type_params=[],  # type: ignore
-                ),
+            ast.ClassDef(
+                name=type_info.py_type,
+                bases=[base_class],
+                keywords=[],
+                body=body,
+                decorator_list=decorators,
+                type_params=[],  # type: ignore
             )
         ]
 
@@ -144,7 +162,7 @@ class PythonCodeGenerator(CodeGenerator):
         return ast.ClassDef(
             name=field.operation_name,
             body=[func],
-            bases=[ast_for_name("Protocol")],
+            bases=[_PROTOCOL],
             keywords=[],
             decorator_list=[],
             type_params=[],  # type: ignore
@@ -154,25 +172,7 @@ class PythonCodeGenerator(CodeGenerator):
         """
         Render a computed field as an AST node for a function definition.
         """
-        args = [
-            ast.arg("self"),
-            ast.arg(
-                "info",
-                annotation=ast_for_single_subscript(
-                    ast_for_name("ResolveInfo"), ast_for_constant("Context")
-                ),
-            ),
-            *field.positional_args,
-        ]
-        args_node = ast.arguments(
-            args=args,
-            vararg=None,
-            posonlyargs=[],
-            kwonlyargs=field.kwonlyargs,
-            kw_defaults=field.kwdefaults,
-            kwarg=None,
-            defaults=[],
-        )
+        args_node = ast_for_resolver_args(field)
         body = ast_for_function_body(field)
         body.append(ELLIPSIS)
         func_node = ast.AsyncFunctionDef(
@@ -180,77 +180,56 @@ class PythonCodeGenerator(CodeGenerator):
             args=args_node,
             body=body,
             decorator_list=[],
-            returns=ast.Name(id=field.type, ctx=ast.Load()),
+            returns=ast_for_name(field.type),
             type_params=[],  # type: ignore
+            lineno=None,  # type: ignore
         )
         return func_node
 
     def render_operation_types(self) -> list[ast.stmt]:
         """Create AST nodes for operation (Query/Mutation) types"""
-        operation_fields: List[Field] = []
+        root_fields: list[ast.stmt] = []
         field_classes: list[ast.stmt] = []
 
         for field in self.analyzer.operation_fields:
-            if field.name == "_empty":
-                continue
-
-            operation_fields.append(field)
-            field_classes.append(cast(ast.stmt, self.ast_for_operation(field)))
+            field_classes.append(self.ast_for_operation(field))
+            root_fields.append(
+                ast_for_annotation_assignment(
+                    field.name, annotation=ast_for_name(field.operation_type)
+                )
+            )
 
         if field_classes:
             root_type = ast.ClassDef(
                 name="RootType",
-                body=cast(
-                    list[ast.stmt],
-                    [
-                        ast_for_annotation_assignment(
-                            f.name, annotation=ast_for_name(f.operation_type)
-                        )
-                        for f in operation_fields
-                    ],
-                ),
-                bases=[ast_for_name("TypedDict")],
-                keywords=[ast_for_keyword("total", False)],
+                body=root_fields,
+                bases=[_TYPED_DICT],
+                keywords=_ROOT_TYPE_KEYWORDS,
                 decorator_list=[],
                 type_params=[],  # type: ignore
             )
-            field_classes.append(cast(ast.stmt, root_type))
+            field_classes.append(root_type)
 
         return field_classes
 
-    def render_type_checking(self):
-        return ast.If(
-            test=ast_for_name("TYPE_CHECKING"),
-            body=[
-                ast_for_import_from(
-                    module="context",
-                    names={"Context"},
-                    level=1,
-                )
-            ],
-            orelse=[],
-        )
+    def render_type_checking(self) -> ast.If:
+        return _TYPE_CHECKING_CONTEXT
 
     def generate(self, use_pydantic: bool) -> str:
         """Generate complete Python code from the schema"""
-        body: list[ast.stmt] = [self.render_type_checking()]
-
-        # Generate code for each type
-        for interface in self.analyzer.interface_types:
-            body.append(interface.as_ast)
-
-        for input_type in self.analyzer.input_types:
-            body.append(input_type.as_ast)
-
-        for obj_type in self.analyzer.object_types:
-            obj = self.render_object_type(obj_type, use_pydantic)
-            body.extend(cast(list[ast.stmt], obj))
-
-        for union_type in self.analyzer.union_types:
-            body.append(union_type.as_ast)
-
-        # Generate operation types
-        body.extend(cast(list[ast.stmt], self.render_operation_types()))
+        # Generate code for each type followed by the operation types
+        body: list[ast.stmt] = [
+            self.render_type_checking(),
+            *(interface.as_ast for interface in self.analyzer.interface_types),
+            *(input_type.as_ast for input_type in self.analyzer.input_types),
+            *(
+                obj
+                for obj_type in self.analyzer.object_types
+                for obj in self.render_object_type(obj_type, use_pydantic)
+            ),
+            *(union_type.as_ast for union_type in self.analyzer.union_types),
+            *self.render_operation_types(),
+        ]
 
         module = self.create_module(body)
-        return format_code(module)
+        return format_code(module, pretty=self.pretty)
@@ -1,4 +1,4 @@
-from typing import Any, List, cast
+from typing import Any, Callable, List, cast
 from graphql import (
     GraphQLArgument,
     GraphQLField,
@@ -12,6 +12,13 @@ from cannula.codegen.parse_type import parse_graphql_type
 from cannula.errors import SchemaValidationError
 from cannula.types import Argument, FieldMetadata
 
+# GraphQL types map to Python types for default values
+_DEFAULT_VALUE_TYPES: dict[str, Callable[[Any], Any]] = {
+    "bool": bool,
+    "float": float,
+    "int": int,
+}
+
 
 def parse_default_value(arg: GraphQLArgument, field_type: str) -> Any:
     """
@@ -24,14 +31,7 @@ def parse_default_value(arg: GraphQLArgument, field_type: str) -> Any:
     if arg.default_value is Undefined:
         return None
 
-    # GraphQL types map to Python types for default values
-    type_map = {
-        "bool": bool,
-        "float": float,
-        "int": int,
-    }
-
-    if value_func := type_map.get(field_type):
+    if value_func := _DEFAULT_VALUE_TYPES.get(field_type):
         return value_func(arg.default_value)
 
     # For other types, return the default value as is
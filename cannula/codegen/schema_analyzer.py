@@ -16,6 +16,7 @@ from typing import (
     DefaultDict,
     Dict,
     List,
+    Optional,
     cast,
 )
 
@@ -35,6 +36,7 @@ from graphql import (
 from cannula.codegen.parse_args import parse_field_arguments, parse_related_args
 from cannula.codegen.parse_type import parse_graphql_type
 from cannula.types import (
+    EMPTY_FIELD_METADATA,
     Field,
     FieldMetadata,
     FieldType,
@@ -56,6 +58,7 @@ class SchemaExtension:
         self.schema = schema
         self._type_metadata = schema.extensions.get("type_metadata", {})
         self._imports = schema.extensions.get("imports", {})
+        self._import_statements: Optional[List[ast.ImportFrom]] = None
 
     @property
     def type_metadata(self) -> Dict[str, Dict[str, Any]]:
@@ -65,6 +68,17 @@ class SchemaExtension:
     def imports(self) -> Dict[str, set[str]]:
         return self._imports
 
+    @property
+    def import_statements(self) -> List[ast.ImportFrom]:
+        """Sorted import statements, shared by every module generated for the schema."""
+        if self._import_statements is None:
+            self._import_statements = [
+                ast_for_import_from(module=mod, names=self._imports[mod])
+                for mod in sorted(self._imports.keys())
+                if mod != "builtins"
+            ]
+        return self._import_statements
+
     def get_type_metadata(self, type_name: str) -> Dict[str, Any]:
         """Get metadata for a specific type"""
         return self.type_metadata.get(type_name, {})
@@ -121,7 +135,10 @@ class SchemaAnalyzer:
 
             if name in ("Query", "Mutation", "Subscription"):
                 self.operation_types.append(obj)
-                self.operation_fields.extend(obj.fields)
+                # Skip the placeholder fields added to empty root types
+                self.operation_fields.extend(
+                    [field for field in obj.fields if field.name != "_empty"]
+                )
             else:
                 self.object_types.append(obj)
 
@@ -175,10 +192,10 @@ class SchemaAnalyzer:
         for _field_name, field_def in node.fields.items():
             field_meta = cast(
                 FieldMetadata,
-                field_def.extensions.get("field_meta", FieldMetadata()),
+                field_def.extensions.get("field_meta", EMPTY_FIELD_METADATA),
             )
             if fk := field_meta.foreign_key:
-                table_name = fk.split(".")[0]
+                table_name, _, _ = fk.partition(".")
                 fk_fields[table_name] = cast(GraphQLField, field_def)
 
         return ObjectType(
@@ -243,7 +260,7 @@ class SchemaAnalyzer:
             fk_fields=fk_fields,
         )
         args = parse_field_arguments(field_def)
-        field_metadata = field_def.extensions.get("field_meta", FieldMetadata())
+        field_metadata = field_def.extensions.get("field_meta", EMPTY_FIELD_METADATA)
         related_args = parse_related_args(field_name, field_metadata, parent)
         return Field.from_field(
             name=field_name,
@@ -265,33 +282,23 @@ class SchemaAnalyzer:
 class CodeGenerator(ABC):
     """Base class for code generators with common functionality."""
 
-    def __init__(self, analyzer: SchemaAnalyzer):
+    def __init__(self, analyzer: SchemaAnalyzer, pretty: bool = True):
         self.analyzer = analyzer
         self.schema = analyzer.schema
-        self.imports = analyzer.extensions.imports
-
-    def get_db_types(self) -> List[ObjectType]:
-        """Get all types that have db_table metadata"""
-        return [
-            type_info
-            for type_info in self.analyzer.object_types
-            if type_info.is_db_type
-        ]
+        # Format the output with black, see `cannula.format.format_code`
+        self.pretty = pretty
 
     def create_import_statements(self) -> List[ast.ImportFrom]:
         """Create AST nodes for import statements."""
-        module_imports = sorted(self.imports.keys())
-        return [
-            ast_for_import_from(module=mod, names=self.imports[mod])
-            for mod in module_imports
-            if mod != "builtins"
-        ]
+        return self.analyzer.extensions.import_statements
 
     def create_module(self, body: List[ast.stmt]) -> ast.Module:
         """Create an AST module with imports and body."""
         imports = self.create_import_statements()
-        module = ast.Module(body=imports + body, type_ignores=[])
-        return ast.fix_missing_locations(module)
+        # The module is only unparsed so it does not need positions, the
+        # statements that ast.unparse checks for type comments are created
+        # with `lineno=None` instead.
+        return ast.Module(body=imports + body, type_ignores=[])
 
     @abstractmethod
     def generate(self, *args, **kwargs) -> str:  # pragma: no cover
@@ -1,27 +1,115 @@
 import ast
 import logging
 
-import autoflake
 import black
 
 # Disable noisy debug logs
 black_log = logging.getLogger("blib2to3")
 black_log.setLevel(logging.ERROR)
 
+# Black options are the same for every module so only create them once
+BLACK_MODE = black.Mode()
 
-def format_code(root: ast.Module) -> str:
-    # Convert AST to source code
-    source_code = ast.unparse(root)
 
-    # Remove unused imports and variables
-    fixed_code = autoflake.fix_code(
-        source=source_code,
-        remove_all_unused_imports=True,
-        remove_unused_variables=True,
-        remove_duplicate_keys=True,
-    )
+def _add_expression_names(source: str, names: set[str]) -> None:
+    try:
+        expression = ast.parse(source, mode="eval")
+    except SyntaxError:
+        return
+    _add_annotation_names(expression.body, names)
+
+
+def _add_name(name: str, names: set[str]) -> None:
+    # The generators use names for whole expressions like `Optional[User]`
+    if name.isidentifier():
+        names.add(name)
+    else:
+        _add_expression_names(name, names)
+
+
+def _add_annotation_names(annotation: ast.expr, names: set[str]) -> None:
+    for node in ast.walk(annotation):
+        if isinstance(node, ast.Name):
+            _add_name(node.id, names)
+        # Forward references like `ResolveInfo["Context"]`
+        elif isinstance(node, ast.Constant) and isinstance(node.value, str):
+            _add_expression_names(node.value, names)
+
+
+def _used_names(root: ast.Module) -> set[str]:
+    names: set[str] = set()
+    for node in ast.walk(root):
+        if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Load):
+            _add_name(node.id, names)
+        elif isinstance(node, (ast.arg, ast.AnnAssign)) and node.annotation:
+            _add_annotation_names(node.annotation, names)
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            if node.returns:
+                _add_annotation_names(node.returns, names)
+
+    # Top level definitions that shadow an import keep it around
+    for statement in root.body:
+        if isinstance(statement, (ast.ClassDef, ast.FunctionDef)):
+            names.add(statement.name)
+
+    return names
+
+
+def _bound_name(alias: ast.alias) -> str:
+    # Aliases are also written inline like `Context as BaseContext`
+    return alias.asname or alias.name.rpartition(" as ")[2]
+
+
+def _prune_imports(body: list[ast.stmt], used: set[str]) -> list[ast.stmt]:
+    pruned: list[ast.stmt] = []
+    for statement in body:
+        if isinstance(statement, ast.ImportFrom) and statement.module != "__future__":
+            aliases = [alias for alias in statement.names if _bound_name(alias) in used]
+            if len(aliases) != len(statement.names):
+                if not aliases:
+                    continue
+                statement = ast.ImportFrom(
+                    module=statement.module, names=aliases, level=statement.level
+                )
+        elif isinstance(statement, ast.If):
+            if_body = _prune_imports(statement.body, used)
+            if len(if_body) != len(statement.body):
+                statement = ast.If(
+                    test=statement.test,
+                    body=if_body or [ast.Pass()],
+                    orelse=statement.orelse,
+                )
+        pruned.append(statement)
+
+    return pruned
+
+
+def remove_unused_imports(root: ast.Module) -> ast.Module:
+    """Return a copy of the module without the imports that are not used.
+
+    The generators import everything they might need, this drops the names
+    that are never referenced (including string forward references in
+    annotations). The original nodes are not modified since some of them
+    are shared between modules.
+    """
+    used = _used_names(root)
+    return ast.Module(body=_prune_imports(root.body, used), type_ignores=[])
+
+
+def format_code(root: ast.Module, pretty: bool = True) -> str:
+    """Convert the generated module to source code.
+
+    Black is by far the slowest step of code generation, when `pretty` is
+    False the formatting is skipped and the cleaned up `ast.unparse` output
+    is returned instead. The code is equivalent just not as nicely styled.
+    """
+    # Remove unused imports and convert AST to source code
+    fixed_code = ast.unparse(remove_unused_imports(root))
+
+    if not pretty:
+        return f"{fixed_code}\n"
 
     # format with black
-    formatted_code = black.format_str(fixed_code, mode=black.FileMode())
+    formatted_code = black.format_str(fixed_code, mode=BLACK_MODE)
 
     return formatted_code
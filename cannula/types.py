@@ -1,5 +1,6 @@
 import ast
 import dataclasses
+import functools
 import typing
 
 from graphql import (
@@ -29,7 +30,7 @@ class SQLMetadata:
     constraints: typing.List[str] = dataclasses.field(default_factory=list)
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, frozen=True)
 class FieldMetadata:
     primary_key: bool = False
     foreign_key: typing.Optional[str] = None
@@ -44,28 +45,34 @@ class FieldMetadata:
     weight: typing.Optional[float] = None
 
 
-@dataclasses.dataclass
+# Shared metadata for fields that do not declare any, this avoids creating a
+# new (identical) instance every time the metadata is looked up. The metadata
+# is frozen so sharing one instance is safe.
+EMPTY_FIELD_METADATA = FieldMetadata()
+
+
+@dataclasses.dataclass(slots=True)
 class FieldType:
     value: str
     required: bool = False
     of_type: str = ""
     is_list: bool = False
     is_object_type: bool = False
+    # The annotations are derived from the values above and read for nearly
+    # every generated line, so they are computed once in `__post_init__`.
+    safe_value: str = dataclasses.field(init=False, repr=False, compare=False)
+    type: str = dataclasses.field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.safe_value = self.value or "Any"
+        self.type = self.safe_value if self.required else f"Optional[{self.safe_value}]"
 
     def __repr__(self) -> str:
         _type = self.of_type or self.safe_value
         return f"[{_type}]" if self.is_list else _type
 
-    @property
-    def safe_value(self) -> str:
-        return self.value or "Any"
-
-    @property
-    def type(self) -> str:
-        return self.safe_value if self.required else f"Optional[{self.safe_value}]"
 
-
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Argument:
     name: str
     type: typing.Any = None
@@ -105,7 +112,7 @@ class Directive:
         return {arg.name: arg.value for arg in self.args}
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Field:
     field: GraphQLField
     parent: str
@@ -117,6 +124,36 @@ class Field:
     default: typing.Any = None
     computed: bool = False
     fk_field: typing.Optional["Field"] = None
+    # These are read by both the types and context generators, the args
+    # and type do not change so they are computed in `__post_init__`.
+    is_computed: bool = dataclasses.field(init=False, repr=False, compare=False)
+    positional_args: list[ast.arg] = dataclasses.field(
+        init=False, repr=False, compare=False
+    )
+    kwonlyargs: list[ast.arg] = dataclasses.field(init=False, repr=False, compare=False)
+    kwdefaults: list[ast.expr | None] = dataclasses.field(
+        init=False, repr=False, compare=False
+    )
+    # Slotted classes have no instance __dict__ for functools.cached_property,
+    # so nodes that are rendered on first use are memoized in a field instead.
+    _class_var: typing.Optional[ast.AnnAssign] = dataclasses.field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self.is_computed = bool(self.args) or self.field_type.is_object_type
+
+        # Postional args are required, keyword only args are not required
+        # and default to either the provided value or 'None'.
+        self.positional_args = []
+        self.kwonlyargs = []
+        self.kwdefaults = []
+        for arg in self.args:
+            if arg.required:
+                self.positional_args.append(arg.as_ast)
+            else:
+                self.kwonlyargs.append(arg.as_ast)
+                self.kwdefaults.append(ast_for_constant(arg.default))
 
     @classmethod
     def from_field(
@@ -160,7 +197,7 @@ class Field:
 
     @property
     def metadata(self) -> FieldMetadata:
-        return self.field.extensions.get("field_meta", FieldMetadata())
+        return self.field.extensions.get("field_meta", EMPTY_FIELD_METADATA)
 
     @property
     def operation_name(self) -> str:
@@ -172,11 +209,6 @@ class Field:
             self.operation_name if self.required else f"Optional[{self.operation_name}]"
         )
 
-    @property
-    def is_computed(self) -> bool:
-        has_args = bool(self.args)
-        return has_args or self.field_type.is_object_type
-
     @property
     def relation_method(self) -> str:
         if self.fk_field is not None:
@@ -202,21 +234,6 @@ class Field:
     def optional_args(self) -> list[Argument]:
         return [arg for arg in self.args if not arg.required]
 
-    @property
-    def positional_args(self) -> list[ast.arg]:
-        """Postional args for this field that are required"""
-        return [arg.as_ast for arg in self.required_args]
-
-    @property
-    def kwonlyargs(self) -> list[ast.arg]:
-        """Keyword only args are for this field that are not required"""
-        return [arg.as_ast for arg in self.optional_args]
-
-    @property
-    def kwdefaults(self) -> list[ast.expr | None]:
-        """Defaults constants for the args either provided value or 'None'"""
-        return [ast.Constant(value=arg.default) for arg in self.optional_args]
-
     @property
     def keywords(self) -> list[ast.keyword]:
         """These are used in a function body to call an another function.
@@ -245,6 +262,9 @@ class Field:
 
     @property
     def as_class_var(self) -> ast.AnnAssign:
+        if self._class_var is not None:
+            return self._class_var
+
         field_type = ast_for_name(self.type)
 
         # Handle the defaults properly. When the field is required we don't want to
@@ -254,9 +274,10 @@ class Field:
         if not self.required:
             default = ast_for_constant(self.default)
 
-        return ast_for_annotation_assignment(
+        self._class_var = ast_for_annotation_assignment(
             self.name, annotation=field_type, default=default
         )
+        return self._class_var
 
     @property
     def as_typed_dict_var(self) -> ast.AnnAssign:
@@ -276,7 +297,7 @@ class Field:
             )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ObjectType:
     """Container for type information and metadata"""
 
@@ -285,6 +306,23 @@ class ObjectType:
     py_type: str
     fields: list[Field]
     related_fields: list[Field] = dataclasses.field(default_factory=list)
+    # Every generator splits the fields into stored and computed ones, the
+    # fields do not change after the analysis so split them once here.
+    storage_fields: list[Field] = dataclasses.field(
+        init=False, repr=False, compare=False
+    )
+    computed_fields: list[Field] = dataclasses.field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self.storage_fields = []
+        self.computed_fields = []
+        for field in self.fields:
+            if field.is_computed:
+                self.computed_fields.append(field)
+            else:
+                self.storage_fields.append(field)
 
     @property
     def description(self) -> typing.Optional[str]:
@@ -327,7 +365,7 @@ class InterfaceType:
     def description(self) -> typing.Optional[str]:
         return self.node.description
 
-    @property
+    @functools.cached_property
     def as_ast(self) -> ast.ClassDef:
         body: list[ast.stmt] = []
         if self.description:
@@ -347,20 +385,28 @@ class InterfaceType:
         )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class UnionType:
     node: GraphQLUnionType
     name: str
     py_type: str
     types: typing.List[FieldType]
+    # Memoized by as_ast, see Field._class_var
+    _ast: typing.Optional[ast.Assign] = dataclasses.field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @property
     def as_ast(self) -> ast.Assign:
+        if self._ast is not None:
+            return self._ast
+
         member_types = [t.safe_value for t in self.types]
-        return ast_for_assign(
+        self._ast = ast_for_assign(
             self.py_type,
             ast_for_union_subscript(*member_types),
         )
+        return self._ast
 
 
 @dataclasses.dataclass
@@ -375,7 +421,7 @@ class InputType:
     def description(self) -> typing.Optional[str]:
         return self.node.description
 
-    @property
+    @functools.cached_property
     def as_ast(self) -> ast.ClassDef:
         body: list[ast.stmt] = []
         if self.description:
@@ -1,12 +1,40 @@
 import ast
+import functools
 import typing
 
 from graphql import parse, DocumentNode
 
-# AST contants for common values
+# AST contants for common values. The generated nodes are never modified, they
+# are only read by the unparser, so a single instance can be shared anywhere it
+# appears in the generated code.
 NONE = ast.Constant(value=None)
+TRUE = ast.Constant(value=True)
+FALSE = ast.Constant(value=False)
 ELLIPSIS = ast.Expr(value=ast.Constant(value=Ellipsis))
 PASS = ast.Pass()
+SELF_ARG = ast.arg("self")
+
+# Special cases and irregular plurals could be added here
+IRREGULAR_PLURALS = {
+    "person": "people",
+    "child": "children",
+    "goose": "geese",
+    "mouse": "mice",
+    "criterion": "criteria",
+}
+
+# Words ending in -o that add -es, most just add -s
+O_ES_ENDINGS = frozenset(
+    {
+        "hero",
+        "potato",
+        "tomato",
+        "echo",
+        "veto",
+        "volcano",
+        "tornado",
+    }
+)
 
 
 def gql(schema: str) -> DocumentNode:
@@ -16,23 +44,17 @@ def gql(schema: str) -> DocumentNode:
     return parse(schema)
 
 
+@functools.lru_cache(maxsize=1024)
 def pluralize(name: str) -> str:
     """Pluralized name used for the attribute on the context object.
 
-    Follows English pluralization rules.
+    Follows English pluralization rules. The results are cached since the
+    same type names are pluralized for every field that references them.
     """
     _attr = name.lower()
 
-    # Special cases and irregular plurals could be added here
-    irregular_plurals = {
-        "person": "people",
-        "child": "children",
-        "goose": "geese",
-        "mouse": "mice",
-        "criterion": "criteria",
-    }
-    if _attr in irregular_plurals:
-        return irregular_plurals[_attr]
+    if _attr in IRREGULAR_PLURALS:
+        return IRREGULAR_PLURALS[_attr]
 
     # Words ending in -is change to -es
     if _attr.endswith("is"):
@@ -65,16 +87,7 @@ def pluralize(name: str) -> str:
         return f"{_attr[:-1]}ves"
 
     # Words ending in -o: some add -es, most just add -s
-    o_es_endings = {
-        "hero",
-        "potato",
-        "tomato",
-        "echo",
-        "veto",
-        "volcano",
-        "tornado",
-    }
-    if _attr in o_es_endings:
+    if _attr in O_ES_ENDINGS:
         return f"{_attr}es"
 
     # Default case: just add s
@@ -91,11 +104,22 @@ def ast_for_import_from(module: str, names: set[str], level: int = 0) -> ast.Imp
     return ast.ImportFrom(module=module, names=ast_names, level=level)
 
 
+# The same names are used all over the generated code, share a node per name.
+# The cache is bounded since it lives as long as the process does.
+@functools.lru_cache(maxsize=1024)
 def ast_for_name(name: str) -> ast.expr:
     return ast.Name(id=name, ctx=ast.Load())
 
 
 def ast_for_constant(value: typing.Any) -> ast.expr:
+    # Reuse the shared nodes for the most common values, the identity checks
+    # keep `1` and `0` from matching `True` and `False`.
+    if value is None:
+        return NONE
+    if value is True:
+        return TRUE
+    if value is False:
+        return FALSE
     return ast.Constant(value=value)
 
 
@@ -1,12 +1,26 @@
+import dataclasses
+import os
 import tempfile
 import pathlib
+import typing
 
 import pytest
+from black import format_str
 
 from cannula.codegen import (
+    render_code,
     render_file,
 )
+from cannula.codegen.codegen import (
+    _ANALYZER_CACHE,
+    _IMPORTS,
+    _RENDER_CACHE,
+    _default_imports,
+    clear_render_cache,
+)
+from cannula.format import BLACK_MODE
 from cannula.scalars import ScalarInterface
+from cannula.scalars._base import ModuleImport
 from cannula.scalars.date import Datetime
 
 SCHEMA = '''
@@ -351,3 +365,91 @@ async def test_render_file(
             content = rendered.read()
 
             assert content == expected
+
+
+def test_render_file_skips_unchanged_files():
+    with tempfile.TemporaryDirectory() as generated_dir:
+        destination = pathlib.Path(generated_dir)
+        render_file(type_defs=[SCHEMA, EXTENTIONS], dest=destination)
+
+        types_file = destination / "types.py"
+        first_mtime = types_file.stat().st_mtime_ns
+        os.utime(types_file, ns=(first_mtime - 10_000, first_mtime - 10_000))
+        render_file(type_defs=[SCHEMA, EXTENTIONS], dest=destination)
+
+        assert types_file.stat().st_mtime_ns == first_mtime - 10_000
+        assert types_file.read_text() == expected_output
+
+        types_file.write_text("stale")
+        render_file(type_defs=[SCHEMA, EXTENTIONS], dest=destination)
+
+        assert types_file.read_text() == expected_output
+
+
+def test_render_code_is_cached():
+    clear_render_cache()
+    first = render_code(type_defs=[SCHEMA, EXTENTIONS])
+    assert len(_RENDER_CACHE) == 1
+
+    first["types"] = "modified"
+    second = render_code(type_defs=[SCHEMA, EXTENTIONS])
+
+    assert second["types"] == expected_output
+    assert len(_RENDER_CACHE) == 1
+
+    # The schema analysis is shared between the dataclass and pydantic output
+    pydantic = render_code(type_defs=[SCHEMA, EXTENTIONS], use_pydantic=True)
+    assert len(_RENDER_CACHE) == 2
+    assert len(_ANALYZER_CACHE) == 1
+    assert pydantic["types"] != second["types"]
+    assert pydantic["sql"] == second["sql"]
+
+    clear_render_cache()
+    assert len(_RENDER_CACHE) == 0
+    assert len(_ANALYZER_CACHE) == 0
+
+
+def test_render_code_without_formatting():
+    pretty = render_code(type_defs=[SCHEMA, EXTENTIONS])
+    fast = render_code(type_defs=[SCHEMA, EXTENTIONS], pretty=False)
+
+    assert fast["types"] != pretty["types"]
+    assert format_str(fast["types"], mode=BLACK_MODE) == pretty["types"]
+
+
+def test_render_code_scalars_do_not_change_default_imports():
+    clear_render_cache()
+    render_code(type_defs=[schema_interface], scalars=[Datetime])
+
+    assert "datetime" not in _IMPORTS
+    assert _IMPORTS == _default_imports()
+
+
+@dataclasses.dataclass
+class UnhashableDatetime:
+    name: str = "Datetime"
+    input_module: ModuleImport = ModuleImport("datetime", "datetime")
+    output_module: ModuleImport = ModuleImport("builtins", "str")
+
+    @staticmethod
+    def serialize(value: typing.Any) -> typing.Any:
+        return value.isoformat()
+
+    @staticmethod
+    def parse_value(value: typing.Any) -> typing.Any:
+        return value
+
+
+def test_render_code_with_unhashable_scalar():
+    clear_render_cache()
+    scalars: list[ScalarInterface] = [UnhashableDatetime()]
+    generated = render_code(type_defs=[schema_scalars], scalars=scalars)
+
+    assert generated["types"] == expected_scalars
+    assert render_code(type_defs=[schema_scalars], scalars=scalars) == generated
+    assert len(_RENDER_CACHE) == 1
+
+    # The analysis is shared with the pydantic render of the same schema
+    render_code(type_defs=[schema_scalars], scalars=scalars, use_pydantic=True)
+    assert len(_RENDER_CACHE) == 2
+    assert len(_ANALYZER_CACHE) == 1
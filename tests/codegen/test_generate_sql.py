@@ -135,6 +135,19 @@ type Project {
 """
 )
 
+INVALID_FOREIGN_KEY = gql(
+    """
+type User @db_sql {
+    id: ID! @field_meta(primary_key: true)
+}
+
+type Post @db_sql {
+    id: ID! @field_meta(primary_key: true)
+    author_id: ID! @field_meta(foreign_key: "users")
+}
+"""
+)
+
 
 @pytest.mark.parametrize(
     "schema, expected",
@@ -154,6 +167,11 @@ type Project {
             "Field<User.project_id> references foreign_key 'projects.id' which is not marked as a database table",
             id="invalid-relation",
         ),
+        pytest.param(
+            [INVALID_FOREIGN_KEY],
+            "Field<Post.author_id> references foreign_key 'users' which is not in the format 'table.column'",
+            id="invalid-foreign-key",
+        ),
     ],
 )
 def test_generate_sql_errors(schema, expected):
@@ -112,6 +112,19 @@ mock_types = {
 def test_parse_graphql_type(type_obj: Any, expected: FieldType):
     result = parse_graphql_type(type_obj)
     assert result == expected
+    assert result.type == expected.type
+
+
+@pytest.mark.parametrize(
+    "field_type, expected",
+    [
+        pytest.param(FieldType("str", True), "str", id="required"),
+        pytest.param(FieldType("str"), "Optional[str]", id="optional"),
+        pytest.param(FieldType(""), "Optional[Any]", id="missing-value"),
+    ],
+)
+def test_field_type_annotation(field_type: FieldType, expected: str):
+    assert field_type.type == expected
 
 
 @pytest.mark.parametrize(
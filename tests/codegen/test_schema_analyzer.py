@@ -1,7 +1,8 @@
 from typing import Dict, Any, Optional
 from graphql import GraphQLObjectType
 
-from cannula.codegen.schema_analyzer import ObjectType
+from cannula.codegen.schema_analyzer import ObjectType, SchemaAnalyzer
+from cannula.schema import build_and_extend_schema
 from cannula.types import SQLMetadata
 
 
@@ -42,3 +43,23 @@ def test_typeinfo_full_initialization():
     assert type_info.is_db_type is True
     assert type_info.db_type == "DBUser"
     assert type_info.context_attr == "users"
+
+
+def test_typeinfo_splits_computed_fields():
+    schema = build_and_extend_schema(
+        [
+            """
+            type User {
+                id: ID!
+                name: String
+                friend: User
+                posts(limit: Int): [String]
+            }
+            type Query { me: User }
+            """
+        ]
+    )
+    type_info = SchemaAnalyzer(schema).object_types_by_name["User"]
+
+    assert [f.name for f in type_info.storage_fields] == ["id", "name"]
+    assert [f.name for f in type_info.computed_fields] == ["friend", "posts"]
@@ -35,6 +35,7 @@ def test_codegen(mocker: MockerFixture):
         dry_run=False,
         scalars=[],
         use_pydantic=False,
+        pretty=True,
     )
 
 
@@ -58,6 +59,7 @@ def test_codegen_dry_run(mocker: MockerFixture):
         scalars=[],
         dry_run=True,
         use_pydantic=False,
+        pretty=True,
     )
 
 
@@ -82,6 +84,23 @@ def test_codegen_scalars(mocker: MockerFixture):
         scalars=expected_scalars,
         dry_run=False,
         use_pydantic=False,
+        pretty=True,
+    )
+
+
+def test_codegen_no_format(mocker: MockerFixture):
+    mock_schema = mocker.Mock()
+    mocker.patch("cannula.load_schema", return_value=mock_schema)
+    mock_render = mocker.patch("cannula.cli.render_file")
+    mocker.patch.object(sys, "argv", ["cli", "codegen", "--no-format"])
+    main()
+    mock_render.assert_called_with(
+        type_defs=mock_schema,
+        dest=mocker.ANY,
+        scalars=[],
+        dry_run=False,
+        use_pydantic=False,
+        pretty=False,
     )
 
 
@@ -0,0 +1,87 @@
+import ast
+
+import pytest
+
+from cannula.format import format_code, remove_unused_imports
+
+SOURCE = """\
+from typing import Any, Optional
+class Foo:
+    name: Optional[str] = None
+"""
+
+
+@pytest.mark.parametrize(
+    "pretty, expected",
+    [
+        pytest.param(
+            True,
+            """\
+from typing import Optional
+
+
+class Foo:
+    name: Optional[str] = None
+""",
+            id="pretty",
+        ),
+        pytest.param(
+            False,
+            """\
+from typing import Optional
+
+class Foo:
+    name: Optional[str] = None
+""",
+            id="fast",
+        ),
+    ],
+)
+def test_format_code(pretty: bool, expected: str):
+    assert format_code(ast.parse(SOURCE), pretty=pretty) == expected
+
+
+def test_remove_unused_imports():
+    module = ast.parse(
+        """\
+from __future__ import annotations
+from cannula import ResolveInfo
+from typing import Any, Optional, TYPE_CHECKING, Union
+from .sql import DBUser
+if TYPE_CHECKING:
+    from .context import Context
+    from .other import Other
+class User(Renamed):
+    def name(self, info: ResolveInfo["Context"]) -> Any:
+        ...
+"""
+    )
+    # The generators write some expressions and aliases as a single name
+    module.body[1].names.extend(
+        [ast.alias(name="Thing as Renamed"), ast.alias(name="Other as Unused")]
+    )
+    module.body.append(
+        ast.AnnAssign(
+            target=ast.Name(id="user", ctx=ast.Store()),
+            annotation=ast.Name(id="Optional[DBUser]", ctx=ast.Load()),
+            simple=1,
+        )
+    )
+    original = ast.unparse(module)
+
+    assert ast.unparse(remove_unused_imports(module)) == (
+        """\
+from __future__ import annotations
+from cannula import ResolveInfo, Thing as Renamed
+from typing import Any, Optional, TYPE_CHECKING
+from .sql import DBUser
+if TYPE_CHECKING:
+    from .context import Context
+
+class User(Renamed):
+
+    def name(self, info: ResolveInfo['Context']) -> Any:
+        ...
+user: Optional[DBUser]"""
+    )
+    assert ast.unparse(module) == original
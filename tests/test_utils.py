@@ -83,3 +83,29 @@ def test_gql():
 def test_context_attr_pluralization(name: str, expected_plural: str):
     actual = utils.pluralize(name)
     assert actual == expected_plural
+
+
+@pytest.mark.parametrize(
+    "value, shared",
+    [
+        pytest.param(None, utils.NONE, id="none"),
+        pytest.param(True, utils.TRUE, id="true"),
+        pytest.param(False, utils.FALSE, id="false"),
+    ],
+)
+def test_ast_for_constant_shares_common_values(value, shared):
+    assert utils.ast_for_constant(value) is shared
+
+
+@pytest.mark.parametrize("value", [0, 1, "true", 1.5])
+def test_ast_for_constant_other_values(value):
+    constant = utils.ast_for_constant(value)
+    assert constant not in (utils.NONE, utils.TRUE, utils.FALSE)
+    assert type(constant.value) is type(value)
+    assert constant.value == value
+
+
+def test_ast_for_name_is_shared():
+    name = utils.ast_for_name("Optional[User]")
+    assert name is utils.ast_for_name("Optional[User]")
+    assert name is not utils.ast_for_name("User")